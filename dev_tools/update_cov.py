@@ -1,6 +1,7 @@
 import json
 import re
 import sys
+from bisect import bisect_right
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).parents[1]
@@ -22,36 +23,34 @@ BADGE_STR = """<svg xmlns="http://www.w3.org/2000/svg" width="120" height="20">
     </g>
 </svg>"""
 
+_PCT_RE = re.compile(r'<text x="90" y="14">([0-9]+(?:\.[0-9]+)?)%</text>')
+_THRESHOLDS = (50, 70, 80, 90)
+_COLOURS = ("red", "orange", "yellow", "yellowgreen", "green")
+
 
 def update_cov_badge(root: str) -> int:
-    cov_report = json.loads(Path(f"{root}/coverage.json").read_text())
+    cov_json = Path(root) / "coverage.json"
+    cov_svg = Path(root) / "coverage.svg"
+
+    if cov_svg.stat().st_mtime >= cov_json.stat().st_mtime:
+        return 0
+
+    cov_report = json.loads(cov_json.read_bytes())
     new_pct = to_2dp_float_str(cov_report["totals"]["percent_covered"])
 
-    curr_badge = Path(f"{root}/coverage.svg").read_text()
-    curr_pct = to_2dp_float_str(
-        re.findall(r'<text x="90" y="14">([0-9]+(?:\.[0-9]+)?)%</text>', curr_badge)[0]
-    )
+    curr_badge = cov_svg.read_text(encoding="utf-8")
+    curr_pct = to_2dp_float_str(_PCT_RE.search(curr_badge).group(1))
 
     if new_pct == curr_pct:
         return 0
 
-    Path(f"{root}/coverage.svg").write_text(make_badge(BADGE_STR, new_pct))
+    cov_svg.write_text(make_badge(BADGE_STR, new_pct), encoding="utf-8")
     return 1
 
 
 def make_badge(badge_str: str, pct: int) -> str:
     pct = float(pct)
-    colour = (
-        "red"
-        if pct < 50  # noqa: PLR2004
-        else "orange"
-        if pct < 70  # noqa: PLR2004
-        else "yellow"
-        if pct < 80  # noqa: PLR2004
-        else "yellowgreen"
-        if pct < 90  # noqa: PLR2004
-        else "green"
-    )
+    colour = _COLOURS[bisect_right(_THRESHOLDS, pct)]
     return badge_str.format(colour=colour, pct=f"{pct:.2f}")
 
 
@@ -1,6 +1,10 @@
 import inspect
+import os
 import re
+import stat
 import sys
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
 import attrs
@@ -18,51 +22,72 @@ from danom import (
     safe_method,
 )
 
+_STRIP_RE = re.compile(r"^[ \t]+|[ \t]+$", flags=re.MULTILINE)
+_API_REF_RE = re.compile(rb"(# API Reference)(.*?)(::)", flags=re.DOTALL)
 
-@attrs.define(frozen=True)
+
+@attrs.define(slots=True, frozen=True)
 class ReadmeDoc:
     name: str
     sig: str = attrs.field(converter=str)
     doc: str
 
     def to_readme(self) -> str:
-        docs = strip_doc(self.doc)
-        return "\n".join([f"### `{self.name}`", f"```python\n{self.name}{self.sig}\n```", docs])
+        return f"### `{self.name}`\n```python\n{self.name}{self.sig}\n```\n{strip_doc(self.doc)}"
 
 
 def create_readme_lines() -> str:
-    readme_lines = []
+    return "\n\n".join(_readme_sections())
+
 
+def _readme_sections() -> Iterator[str]:
     for ent in [Stream, Result]:
-        readme_lines.append(f"## {ent.__name__}")
-        readme_lines.append(strip_doc(ent.__doc__))
-        readme_docs = [
-            ReadmeDoc(f"{ent.__name__}.{k}", inspect.signature(v), v.__doc__)
-            for k, v in inspect.getmembers(ent, inspect.isroutine)
-            if not k.startswith("_")
-        ]
-        readme_lines.extend([entry.to_readme() for entry in readme_docs])
+        yield f"## {ent.__name__}"
+        yield strip_doc(ent.__doc__)
+        for k, v in inspect.getmembers(ent, inspect.isroutine):
+            if not k.startswith("_"):
+                yield ReadmeDoc(f"{ent.__name__}.{k}", inspect.signature(v), v.__doc__).to_readme()
 
     for fn in [safe, safe_method, compose, all_of, any_of, identity, invert, new_type]:
-        readme_lines.append(f"## {fn.__name__}")
-        readme_docs = [ReadmeDoc(f"{fn.__name__}", inspect.signature(fn), fn.__doc__)]
-        readme_lines.extend([entry.to_readme() for entry in readme_docs])
-    return "\n\n".join(readme_lines)
+        yield f"## {fn.__name__}"
+        yield ReadmeDoc(fn.__name__, inspect.signature(fn), fn.__doc__).to_readme()
 
 
-def update_readme(new_docs: str, readme_path: str = "./README.md") -> None:
+def update_readme(new_docs: str, readme_path: str = "./README.md") -> int:
     readme_path = Path(readme_path)
-    readme_txt = readme_path.read_text(encoding="utf-8")
-    pattern = r"(# API Reference)(.*?)(::)"
-    updated_readme = re.sub(pattern, rf"\1\n\n{new_docs}\n\3", readme_txt, flags=re.DOTALL)
-    if readme_txt != updated_readme:
-        readme_path.write_text(updated_readme)
+    readme_bytes = readme_path.read_bytes()
+    new_docs_bytes = new_docs.encode("utf-8")
+    updated_readme = _API_REF_RE.sub(
+        lambda m: m[1] + b"\n\n" + new_docs_bytes + b"\n" + m[3], readme_bytes
+    )
+    if readme_bytes != updated_readme:
+        _atomic_write_bytes(readme_path, updated_readme)
         return 1
     return 0
 
 
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    mode = stat.S_IMODE(path.stat().st_mode) if path.exists() else None
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        if mode is not None:
+            tmp_path.chmod(mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=512)
 def strip_doc(doc: str) -> str:
-    return "\n".join([line.strip() for line in doc.splitlines()])
+    return _STRIP_RE.sub("", doc)
 
 
 if __name__ == "__main__":
@@ -16,7 +16,7 @@ Mappable = Callable[Concatenate[T_co, P], U_co]
 Bindable = Callable[Concatenate[T_co, P], "Either[U_co, E_co]"]
 
 
-@attrs.define(frozen=True)
+@attrs.define(slots=True, frozen=True)
 class Either[T_co, E_co: object](ABC):
     """``Either`` monad. Consists of ``Right`` and ``Left`` for successful and failed operations respectively.
     Each monad is a frozen instance to prevent further mutation.
@@ -165,7 +165,7 @@ class Either[T_co, E_co: object](ABC):
         return result.unwrap()
 
 
-@attrs.define(frozen=True, hash=True)
+@attrs.define(slots=True, frozen=True, hash=True)
 class Right(Either[T_co, Never]):
     inner: Any = attrs.field(default=None)
 
@@ -188,7 +188,7 @@ class Right(Either[T_co, Never]):
         return self.inner
 
 
-@attrs.define(frozen=True, hash=True)
+@attrs.define(slots=True, frozen=True, hash=True)
 class Left(Either[Never, E_co]):
     inner: Any = attrs.field(default=None)
 
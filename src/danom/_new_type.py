@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import inspect
 from collections.abc import Callable, Sequence
-from functools import wraps
-from typing import ParamSpec, Self, TypeVar
+from functools import cache, lru_cache, wraps
+from keyword import iskeyword
+from types import FunctionType
+from typing import ParamSpec, Self, TypeVar, cast
 
 import attrs
 
@@ -52,39 +53,92 @@ def new_type(  # noqa: ANN202
         Email = new_type("Email", str, validators=[has_len])
         Email("some_email@domain.com").upper() == "SOME_EMAIL@DOMAIN.COM"
         Email("some_email@domain.com").map(str.upper) == Email(inner='SOME_EMAIL@DOMAIN.COM')
+
+    Recently created types are cached, calling ``new_type`` again with the same arguments will return the same type.
+    The validators and converters are compared by identity, so a lambda written inline is a new function on every call and never hits the cache.
+
+    .. code-block:: python
+
+        from danom import new_type
+
+        new_type("Email", str, validators=[has_len]) is new_type("Email", str, validators=[has_len])
     """
+    key = (name, base_type, tuple(_to_list(validators)), tuple(_to_list(converters)), frozen)
+    if not _is_hashable(key):
+        # unhashable validators or converters can't be cached so build the type directly
+        return _new_type.__wrapped__(*key)
+    return _new_type(*key)
+
+
+@lru_cache(maxsize=256)
+def _new_type(  # noqa: ANN202
+    name: str,
+    base_type: type,
+    validators: tuple[Callable, ...],
+    converters: tuple[Callable, ...],
+    frozen: bool,  # noqa: FBT001
+):
     kwargs = _callables_to_kwargs(base_type, validators, converters)
 
-    @attrs.define(frozen=frozen, eq=True, hash=frozen)
+    @attrs.define(slots=True, frozen=frozen, eq=True, hash=frozen)
     class _Wrapper[T]:
         inner: T = attrs.field(**kwargs)  # ty: ignore[no-matching-overload]
 
         def map(self, func: Callable[[T], T]) -> Self:
             return self.__class__(func(self.inner))
 
-        locals().update(_create_forward_methods(base_type))
+    for method_name, method in _create_forward_methods(base_type).items():
+        method.__qualname__ = f"{name}.{method_name}"
+        setattr(_Wrapper, method_name, method)
 
     _Wrapper.__name__ = name
     _Wrapper.__qualname__ = name
     return _Wrapper
 
 
-def _create_forward_methods(base_type: type) -> dict[str, Callable]:
-    methods: dict[str, Callable] = {}
-    for attr_name, _ in inspect.getmembers(base_type, inspect.isroutine):
-        if attr_name.startswith("_"):
-            continue
+def _create_forward_methods(base_type: type) -> dict[str, FunctionType]:
+    methods: dict[str, FunctionType] = {}
+    for attr_name in _public_routine_names(base_type):
+        method = _make_forwarder(attr_name)
+        method.__doc__ = getattr(base_type, attr_name).__doc__
+        methods[attr_name] = method
+    return methods
 
-        def make_forwarder(name: str) -> Callable:
-            def method(self, *args: tuple, **kwargs: dict) -> T:  # noqa: ANN001
-                return getattr(self.inner, name)(*args, **kwargs)
 
-            method.__name__ = name
-            method.__doc__ = getattr(base_type, name).__doc__
-            return method
+def _make_forwarder(name: str) -> FunctionType:
+    if not name.isidentifier() or iskeyword(name):
 
-        methods[attr_name] = make_forwarder(attr_name)
-    return methods
+        def method(self, *args: tuple, **kwargs: dict) -> T:  # noqa: ANN001
+            return getattr(self.inner, name)(*args, **kwargs)
+
+        method.__name__ = name
+        return method
+
+    src = f"def {name}(self, *args, **kwargs):\n    return self.inner.{name}(*args, **kwargs)"
+    namespace: dict[str, object] = {"__name__": __name__}
+    exec(src, namespace)  # noqa: S102
+    return cast(FunctionType, namespace[name])
+
+
+def _is_hashable(value: object) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _public_routine_names(base_type: type) -> list[str]:
+    seen: set[str] = set()
+    names = []
+    for cls in base_type.__mro__:
+        for attr_name, value in vars(cls).items():
+            if attr_name.startswith("_") or attr_name in seen:
+                continue
+            seen.add(attr_name)
+            if callable(value) or isinstance(value, (classmethod, staticmethod)):
+                names.append(attr_name)
+    return names
 
 
 def _callables_to_kwargs(
@@ -92,6 +146,9 @@ def _callables_to_kwargs(
     validators: Callable | Sequence[Callable] | None,
     converters: Callable | Sequence[Callable] | None,
 ) -> dict[str, Sequence[Callable]]:
+    if not validators and not converters:
+        return dict(_bare_kwargs(base_type))
+
     kwargs = {"validator": [attrs.validators.instance_of(base_type)], "converter": []}
     kwargs["validator"] += [_validate_bool_func(fn) for fn in _to_list(validators)]
     kwargs["converter"] += _to_list(converters)
@@ -99,6 +156,11 @@ def _callables_to_kwargs(
     return {k: v for k, v in kwargs.items() if v}
 
 
+@cache
+def _bare_kwargs(base_type: type) -> dict[str, Sequence[Callable]]:
+    return {"validator": [attrs.validators.instance_of(base_type)]}
+
+
 P = ParamSpec("P")
 
 
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from collections.abc import Callable
+from abc import abstractmethod
+from collections.abc import Callable, Iterator
+from traceback import TracebackException
 from types import TracebackType
-from typing import Any, Concatenate, Literal, Never, ParamSpec, Self, TypeVar
+from typing import Any, ClassVar, Concatenate, Literal, Never, ParamSpec, Self, TypeVar
 
 import attrs
 from attrs.validators import instance_of
@@ -18,12 +19,17 @@ Mappable = Callable[Concatenate[T_co, P], U_co]
 Bindable = Callable[Concatenate[T_co, P], "Result[U_co, E_co]"]
 
 
-@attrs.define(frozen=True)
-class Result[T_co, E_co: object](ABC):
+@attrs.define(slots=True, frozen=True)
+class Result[T_co, E_co: object]:
     """``Result`` monad. Consists of ``Ok`` and ``Err`` for successful and failed operations respectively.
     Each monad is a frozen instance to prevent further mutation.
+    ``Ok`` is truthy and ``Err`` is falsy so a plain ``if`` can be used to check for errors early.
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init_subclass__(**kwargs)
+        _set_abstract_methods(cls)
+
     @classmethod
     def unit(cls, inner: T_co) -> Ok[T_co]:
         """Unit method. Given an item of type ``T`` return ``Ok(T)``
@@ -170,20 +176,61 @@ class Result[T_co, E_co: object](ABC):
         return result.unwrap()
 
 
-@attrs.define(frozen=True, hash=True)
+def _set_abstract_methods(cls: type) -> None:
+    # `Result` isn't an `ABC` so `isinstance` checks don't go through `ABCMeta.__instancecheck__`,
+    # setting `__abstractmethods__` still makes `object.__new__` refuse to create incomplete classes
+    cls.__abstractmethods__ = frozenset(  # ty: ignore[unresolved-attribute]
+        name
+        for name in dir(cls)
+        if getattr(getattr(cls, name, None), "__isabstractmethod__", False)
+    )
+
+
+_set_abstract_methods(Result)
+
+
 class Ok(Result[T_co, Never]):
-    inner: Any = attrs.field(default=None)
+    # frozen-ness is inherited from the `Result` base so `__init__` writes through the slot descriptor
+    __slots__ = ("inner",)
+    __match_args__ = ("inner",)
+    __attrs_attrs__: ClassVar[tuple[attrs.Attribute, ...]]
+
+    inner: Any
+
+    def __init__(self, inner: Any = None) -> None:  # noqa: ANN401
+        _set_inner(self, inner)
+
+    def __repr__(self) -> str:
+        return f"Ok(inner={self.inner!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.inner,) == (other.inner,)  # ty: ignore[unresolved-attribute]
+
+    def __hash__(self) -> int:
+        return hash((self.__class__, self.inner))
+
+    def __reduce__(self) -> tuple[type[Self], tuple[Any]]:
+        return (self.__class__, (self.inner,))
+
+    def __bool__(self) -> Literal[True]:
+        return True
 
     def is_ok(self) -> Literal[True]:
         return True
 
     def map(self, func: Mappable, *args: P.args, **kwargs: P.kwargs) -> Ok[U_co]:
+        if not args and not kwargs:
+            return Ok(func(self.inner))
         return Ok(func(self.inner, *args, **kwargs))
 
     def map_err(self, func: Mappable, *args: P.args, **kwargs: P.kwargs) -> Self:  # noqa: ARG002
         return self
 
     def and_then(self, func: Bindable, *args: P.args, **kwargs: P.kwargs) -> Result[U_co, E_co]:
+        if not args and not kwargs:
+            return func(self.inner)
         return func(self.inner, *args, **kwargs)
 
     def or_else(self, func: Bindable, *args: P.args, **kwargs: P.kwargs) -> Self:  # noqa: ARG002
@@ -193,36 +240,145 @@ class Ok(Result[T_co, Never]):
         return self.inner
 
 
+# `Result` is frozen so construction writes through the slot descriptors directly
+_set_inner = Ok.inner.__set__
+# `Ok` isn't built by attrs so borrow the field metadata, this keeps `attrs.fields` and `attrs.asdict` working
+Ok.__attrs_attrs__ = attrs.fields(attrs.make_class("Ok", {"inner": attrs.field(default=None)}))
+
+
 SafeArgs = tuple[tuple[Any, ...], dict[str, Any]]
 SafeMethodArgs = tuple[object, tuple[Any, ...], dict[str, Any]]
 
 
-@attrs.define(frozen=True)
 class Err(Result[Never, E_co]):
-    error: Any = attrs.field(default=None)
-    input_args: tuple[()] | SafeArgs | SafeMethodArgs = attrs.field(
-        default=(), validator=instance_of(tuple), repr=False
+    # the `_` prefixed slots are lazily filled caches
+    __slots__ = (
+        "_details_cache",
+        "_error_str_cache",
+        "_hash_cache",
+        "_traceback_cache",
+        "_traceback_chain",
+        "_traceback_obj",
+        "error",
+        "input_args",
     )
-    traceback: str = attrs.field(default="", validator=instance_of(str))
-    details: list[dict[str, Any]] = attrs.field(factory=list, init=False, repr=False)
+    __match_args__ = ("error", "input_args", "traceback")
+    __attrs_attrs__: ClassVar[tuple[attrs.Attribute, ...]]
+
+    error: Any
+    input_args: tuple[()] | SafeArgs | SafeMethodArgs
+    _details_cache: list[dict[str, Any]]
+    _error_str_cache: str
+    _hash_cache: int
+    _traceback_cache: str
+    _traceback_obj: TracebackType | None
+    _traceback_chain: tuple[BaseException | None, BaseException | None, bool]
+    # snapshotting `f_locals` copies every frame's locals and keeps them alive, so it's opt-in
+    capture_locals: ClassVar[bool] = False
+
+    def __init__(
+        self,
+        error: Any = None,  # noqa: ANN401
+        input_args: tuple[()] | SafeArgs | SafeMethodArgs = (),
+        traceback: str = "",
+    ) -> None:
+        if not isinstance(input_args, tuple):
+            raise TypeError(f"'input_args' must be {tuple!r} (got {input_args!r})")
+        if not isinstance(traceback, str):
+            raise TypeError(f"'traceback' must be {str!r} (got {traceback!r})")
+
+        _set_error(self, error)
+        _set_input_args(self, input_args)
+        _set_traceback_cache(self, traceback)
+        _set_traceback_obj(self, error.__traceback__ if isinstance(error, Exception) else None)
 
-    def __attrs_post_init__(self) -> None:
-        if isinstance(self.error, Exception):
-            # little hack explained here: https://www.attrs.org/en/stable/init.html#post-init
-            object.__setattr__(self, "details", self._extract_details(self.error.__traceback__))
+    @classmethod
+    def from_exception(
+        cls, error: Exception, input_args: tuple[()] | SafeArgs | SafeMethodArgs = ()
+    ) -> Err[Exception]:
+        """Create an ``Err`` from a caught exception. Formatting the traceback is deferred until ``traceback`` is first read.
+
+        .. code-block:: python
+
+            from danom import Err
+
+            try:
+                1 / 0
+            except ZeroDivisionError as e:
+                err = Err.from_exception(e)
+
+            err.traceback.endswith("ZeroDivisionError: division by zero\\n") == True
+        """
+        self = cls.__new__(cls)
+        _set_error(self, error)
+        _set_input_args(self, input_args)
+        # snapshot the traceback and the cause/context chain as they are now,
+        # re-raising the error will add frames to the traceback and can replace its context
+        _set_traceback_obj(self, error.__traceback__)
+        _set_traceback_chain(self, (error.__cause__, error.__context__, error.__suppress_context__))
+        return self
+
+    @property
+    def traceback(self) -> str:
+        try:
+            return self._traceback_cache
+        except AttributeError:
+            traceback = "".join(self._format_traceback())
+            object.__setattr__(self, "_traceback_cache", traceback)
+            return traceback
+
+    def _format_traceback(self) -> Iterator[str]:
+        cause, context, suppress_context = self._traceback_chain
+        tb_exc = TracebackException(type(self.error), self.error, self._traceback_obj)
+        tb_exc.__cause__ = _snapshot_exception(cause)
+        tb_exc.__context__ = _snapshot_exception(context)
+        tb_exc.__suppress_context__ = suppress_context
+        return tb_exc.format()
+
+    def __repr__(self) -> str:
+        # the traceback is left out as formatting it would defeat deferring it, it's still on `.traceback`
+        return f"Err(error={self.error!r})"
+
+    def __reduce__(self) -> tuple[type[Self], tuple[Any, tuple, str]]:
+        return (self.__class__, (self.error, self.input_args, self.traceback))
+
+    def __bool__(self) -> Literal[False]:
+        return False
+
+    @property
+    def details(self) -> list[dict[str, Any]]:
+        try:
+            return self._details_cache
+        except AttributeError:
+            details = (
+                self._extract_details(self._traceback_obj)
+                if isinstance(self.error, Exception)
+                else []
+            )
+            object.__setattr__(self, "_details_cache", details)
+            return details
+
+    @property
+    def _error_str(self) -> str:
+        try:
+            return self._error_str_cache
+        except AttributeError:
+            error_str = str(self.error)
+            object.__setattr__(self, "_error_str_cache", error_str)
+            return error_str
 
     def _extract_details(self, tb: TracebackType | None) -> list[dict[str, Any]]:
         trace_info = []
         while tb:
             frame = tb.tb_frame
-            trace_info.append(
-                {
-                    "file": frame.f_code.co_filename,
-                    "func": frame.f_code.co_name,
-                    "line_no": tb.tb_lineno,
-                    "locals": frame.f_locals,
-                }
-            )
+            entry: dict[str, Any] = {
+                "file": frame.f_code.co_filename,
+                "func": frame.f_code.co_name,
+                "line_no": tb.tb_lineno,
+            }
+            if self.capture_locals:
+                entry["locals"] = dict(frame.f_locals)
+            trace_info.append(entry)
             tb = tb.tb_next
         return trace_info
 
@@ -233,12 +389,16 @@ class Err(Result[Never, E_co]):
         return self
 
     def map_err(self, func: Mappable, *args: P.args, **kwargs: P.kwargs) -> Err[F_co]:
+        if not args and not kwargs:
+            return Err(func(self.error))
         return Err(func(self.error, *args, **kwargs))
 
     def and_then(self, func: Bindable, *args: P.args, **kwargs: P.kwargs) -> Self:  # noqa: ARG002
         return self
 
     def or_else(self, func: Bindable, *args: P.args, **kwargs: P.kwargs) -> Result[U_co, E_co]:
+        if not args and not kwargs:
+            return func(self.error)
         return func(self.error, *args, **kwargs)
 
     def unwrap(self) -> T_co:
@@ -250,13 +410,47 @@ class Err(Result[Never, E_co]):
         if not isinstance(other, Err):
             return False
 
-        return all(
-            (
-                type(self.error) is type(other.error),
-                str(self.error) == str(other.error),
-                self.input_args == other.input_args,
-            )
+        return (
+            type(self.error) is type(other.error)
+            and self.input_args == other.input_args
+            and self._error_str == other._error_str
         )
 
     def __hash__(self) -> int:
-        return hash(f"{type(self.error)}{self.error}{self.input_args}")
+        try:
+            return self._hash_cache
+        except AttributeError:
+            pass
+
+        try:
+            hash_ = hash((type(self.error), self._error_str, self.input_args))
+        except TypeError:
+            # kwargs in `input_args` are dicts so fall back to hashing their string form
+            hash_ = hash((type(self.error), self._error_str, str(self.input_args)))
+        object.__setattr__(self, "_hash_cache", hash_)
+        return hash_
+
+
+def _snapshot_exception(error: BaseException | None) -> TracebackException | None:
+    if error is None:
+        return None
+    return TracebackException(type(error), error, error.__traceback__)
+
+
+_set_error = Err.error.__set__
+_set_input_args = Err.input_args.__set__  # ty: ignore[unresolved-attribute]
+_set_traceback_cache = Err._traceback_cache.__set__  # noqa: SLF001  # ty: ignore[unresolved-attribute]
+_set_traceback_chain = Err._traceback_chain.__set__  # noqa: SLF001  # ty: ignore[unresolved-attribute]
+_set_traceback_obj = Err._traceback_obj.__set__  # noqa: SLF001  # ty: ignore[unresolved-attribute]
+# as with `Ok`, `traceback` and `details` are properties so `attrs.asdict` still reads them lazily
+Err.__attrs_attrs__ = attrs.fields(
+    attrs.make_class(
+        "Err",
+        {
+            "error": attrs.field(default=None),
+            "input_args": attrs.field(default=(), validator=instance_of(tuple), repr=False),
+            "traceback": attrs.field(default="", validator=instance_of(str)),
+            "details": attrs.field(factory=list, init=False, repr=False),
+        },
+    )
+)
@@ -1,5 +1,4 @@
 import functools
-import traceback
 from collections.abc import Callable
 from typing import Concatenate, ParamSpec, TypeVar
 
@@ -23,6 +22,14 @@ def safe[**P, U](func: Callable[P, U]) -> Callable[P, Result[U, Exception]]:
             return a + 1
 
         add_one(1) == Ok(inner=2)
+
+    The undecorated function is kept as ``__wrapped__``, this can be called directly in trusted hot paths to skip the ``try``/``except`` and the ``Result`` wrapping.
+
+    .. code-block:: python
+
+        from danom import safe
+
+        add_one.__wrapped__(1) == 2
     """
 
     @functools.wraps(func)
@@ -30,7 +37,7 @@ def safe[**P, U](func: Callable[P, U]) -> Callable[P, Result[U, Exception]]:
         try:
             return Ok(func(*args, **kwargs))
         except Exception as e:  # noqa: BLE001
-            return Err(error=e, input_args=(args, kwargs), traceback=traceback.format_exc())  # ty: ignore[invalid-return-type]
+            return Err.from_exception(e, input_args=(args, kwargs))  # ty: ignore[invalid-return-type]
 
     return wrapper
 
@@ -60,6 +67,6 @@ def safe_method[T, **P, U](
         try:
             return Ok(func(self, *args, **kwargs))
         except Exception as e:  # noqa: BLE001
-            return Err(error=e, input_args=(self, args, kwargs), traceback=traceback.format_exc())  # ty: ignore[invalid-return-type]
+            return Err.from_exception(e, input_args=(self, args, kwargs))  # ty: ignore[invalid-return-type]
 
     return wrapper
@@ -2,20 +2,23 @@ from __future__ import annotations
 
 import asyncio
 import itertools
+import math
+import operator
 import os
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable, Iterable
+from collections.abc import Awaitable, Callable, Iterable, Iterator
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from copy import deepcopy
 from enum import Enum
 from functools import partial, reduce
 from itertools import batched
-from typing import ParamSpec, TypeVar, cast
+from typing import Any, ParamSpec, TypeVar, cast
 
 import attrs
 
 from danom._either import Either
 from danom._result import Result
+from danom._utils import identity
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -33,8 +36,10 @@ AsyncTapFn = Callable[P, Awaitable[None]]
 StreamFn = MapFn | FilterFn | TapFn
 AsyncStreamFn = AsyncMapFn | AsyncFilterFn | AsyncTapFn
 
+_DEFAULT_WORKERS = max(1, (os.cpu_count() or 5) - 1)
 
-@attrs.define(frozen=True)
+
+@attrs.define(slots=True, frozen=True)
 class _BaseStream[T](ABC):
     seq: tuple = attrs.field(validator=attrs.validators.instance_of(tuple))
     ops: tuple = attrs.field(default=(), validator=attrs.validators.instance_of(tuple), repr=False)
@@ -71,17 +76,22 @@ class _BaseStream[T](ABC):
     @abstractmethod
     def collect(self) -> tuple[U, ...]: ...
 
+    @abstractmethod
+    def iterate(self) -> Iterator[U]: ...
+
     @abstractmethod
     def par_collect(self, workers: int = 4, *, use_threads: bool = False) -> tuple[U, ...]: ...
 
     @abstractmethod
-    async def async_collect(self) -> Awaitable[tuple[U, ...]]: ...
+    async def async_collect(
+        self, *, concurrency: int | None = None
+    ) -> Awaitable[tuple[U, ...]]: ...
 
     def __bool__(self) -> bool:
         return bool(self.seq)
 
 
-@attrs.define(frozen=True)
+@attrs.define(slots=True, frozen=True)
 class Stream[T](_BaseStream):
     """An immutable lazy iterator with functional operations.
 
@@ -223,10 +233,31 @@ class Stream[T](_BaseStream):
 
             Stream.from_iterable(range(5)).map(mul, b=2).map(add, b=1).collect() == (1, 3, 5, 7, 9)
 
+        For attribute access and method calls prefer ``operator.attrgetter`` and ``operator.methodcaller`` over lambdas.
+        They run in C and, unlike lambdas, can be pickled for ``par_collect``.
+
+        .. code-block:: python
+
+            from operator import attrgetter, methodcaller
+
+            from danom import Stream
+
+            Stream.from_iterable(users).map(attrgetter("name")).map(methodcaller("lower")).par_collect()
+
+        For expensive pure functions over streams with many repeated values, memoize the function before passing it in.
+
+        .. code-block:: python
+
+            from functools import cache
+
+            from danom import Stream
+
+            Stream.from_iterable(user_ids).map(cache(fetch_user_region)).collect()
+
         """
-        plan = (*self.ops, (_MAP, partial(fn, *args, **kwargs)))
-        object.__setattr__(self, "ops", plan)
-        return self
+        if fn is identity and not args and not kwargs:
+            return self
+        return self._add_op(_MAP, partial(fn, *args, **kwargs))
 
     def filter[**P](
         self, fn: FilterFn | AsyncFilterFn, *args: P.args, **kwargs: P.kwargs
@@ -249,14 +280,13 @@ class Stream[T](_BaseStream):
             Stream.from_iterable(range(20)).filter(divisible_by, x=3).filter(divisible_by, x=5).collect() == (0, 15)
 
         """
-        plan = (*self.ops, (_FILTER, partial(fn, *args, **kwargs)))
-        object.__setattr__(self, "ops", plan)
-        return self
+        return self._add_op(_FILTER, partial(fn, *args, **kwargs))
 
     def tap[**P](self, fn: TapFn | AsyncTapFn, *args: P.args, **kwargs: P.kwargs) -> Stream[T]:
         """Tap the values to another process that returns None. Will return a new ``Stream`` with the modified sequence.
 
         The value passed to the tap function will be deep-copied to avoid any modification to the ``Stream`` item for downstream consumers.
+        Immutable built-in values (``int``, ``float``, ``str``, ``bytes``, ``None`` etc.), and flat ``tuple`` or ``frozenset`` of them, are passed through as they are, as there is nothing to protect.
 
         .. code-block:: python
 
@@ -289,9 +319,11 @@ class Stream[T](_BaseStream):
             inactive_users.tap(log_inactive_users).map(create_dormant_user_entry).map(add_to_dormant_table).collect()
 
         """
-        plan = (*self.ops, (_TAP, partial(fn, *args, **kwargs)))
-        object.__setattr__(self, "ops", plan)
-        return self
+        return self._add_op(_TAP, partial(fn, *args, **kwargs))
+
+    def _add_op(self, op: int, fn: StreamFn) -> Stream[T]:
+        # build a new `Stream` rather than mutating the frozen one so a shared parent can be branched safely
+        return self.__class__(seq=self.seq, ops=(*self.ops, (op, fn)))
 
     def partition(
         self, fn: FilterFn, *, workers: int = 1, use_threads: bool = False
@@ -411,10 +443,33 @@ class Stream[T](_BaseStream):
 
             Stream.from_iterable([1, 2, 3, 4]).map(some_expensive_fn).fold(0, add, workers=4, use_threads=False)
 
+        Passing ``operator.mul``, or ``operator.add`` over ``int`` values, runs the fold in C with ``math.prod`` and ``sum``.
+
+        .. doctest::
+
+            >>> import operator
+            >>> from danom import Stream
+
+            >>> Stream.from_iterable(range(1, 5)).fold(0, operator.add) == 10
+            True
+            >>> Stream.from_iterable(range(1, 5)).fold(1, operator.mul) == 24
+            True
+
         """
         if workers > 1:
-            return reduce(fn, self.par_collect(workers=workers, use_threads=use_threads), initial)
-        return reduce(fn, self.collect(), initial)
+            seq_tuple = self.par_collect(workers=workers, use_threads=use_threads)
+        else:
+            seq_tuple = self.collect()
+
+        if fn is operator.mul:
+            return math.prod(seq_tuple, start=cast(Any, initial))
+        if (
+            fn is operator.add
+            and type(initial) is int
+            and all(type(elem) is int for elem in seq_tuple)
+        ):
+            return sum(seq_tuple, initial)
+        return reduce(fn, seq_tuple, initial)
 
     def collect(self) -> tuple[U, ...]:
         """Materialise the sequence from the ``Stream``.
@@ -427,8 +482,28 @@ class Stream[T](_BaseStream):
             stream.collect() == (1, 2, 3, 4)
 
         """
+        if not self.ops:
+            return self.seq
         return tuple(_apply_fns(self.seq, self.ops))
 
+    def iterate(self) -> Iterator[U]:
+        """Lazily yield the elements of the ``Stream`` without materialising them into a tuple.
+
+        Useful when the result is consumed straight away, e.g. by ``sum``, ``any`` or ``next``, as processing stops as soon as the consumer does.
+
+        .. doctest::
+
+            >>> from danom import Stream
+
+            >>> sum(Stream.from_iterable(range(4)).map(lambda x: x * 2).iterate()) == 12
+            True
+            >>> next(Stream.from_iterable(range(100)).filter(lambda x: x > 10).iterate()) == 11
+            True
+
+        The ``Stream`` is unchanged so ``iterate`` can be called again to replay it. For parallel processing use ``par_collect``.
+        """
+        return _iter_fns(self.seq, self.ops)
+
     def par_collect(self, workers: int = 4, *, use_threads: bool = False) -> tuple[U, ...]:
         """Materialise the sequence from the ``Stream`` in parallel.
 
@@ -461,25 +536,34 @@ class Stream[T](_BaseStream):
 
         Note that all operations should be pickle-able, for that reason ``Stream`` does not support lambdas or closures.
         """
-        if workers == -1:
-            workers = (os.cpu_count() or 5) - 1
+        if not self.ops:
+            return self.seq
 
-        executor_cls = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+        if workers == -1:
+            workers = _DEFAULT_WORKERS
 
         batches = [
-            (list(chunk), self.ops)
-            for chunk in batched(self.seq, n=max(4, len(self.seq) // workers))
+            list(chunk) for chunk in batched(self.seq, n=max(4, -(-len(self.seq) // workers)))
         ]
 
-        with executor_cls(max_workers=workers) as ex:
-            return cast(
-                tuple[U, ...],
-                tuple(itertools.chain.from_iterable(ex.map(_apply_fns_worker, batches))),
-            )
+        if use_threads:
+            step = _compile_ops(self.ops)
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                results = ex.map(partial(_apply_step, step), batches)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(self.ops,)
+            ) as ex:
+                results = ex.map(_apply_fns_worker, batches)
+
+        return cast(tuple[U, ...], tuple(itertools.chain.from_iterable(results)))
 
-    async def async_collect(self) -> Awaitable[tuple[U, ...]]:
+    async def async_collect(self, *, concurrency: int | None = None) -> Awaitable[tuple[U, ...]]:
         """Async version of collect. Note that all functions in the stream should be ``Awaitable``.
 
+        The elements are processed concurrently on the running event loop so the functions should not make blocking calls,
+        offload those with ``asyncio.to_thread`` to keep the other elements progressing.
+
         .. code-block:: python
 
             from danom import Stream
@@ -494,14 +578,29 @@ class Stream[T](_BaseStream):
 
             Stream.from_iterable(file_paths).async_collect()
 
+        Use the ``concurrency`` arg to cap how many elements are in flight at once, for example to stay under the open file limit.
+        The order of the results is preserved. Defaults to ``None`` which processes every element concurrently.
+
+        .. code-block:: python
+
+            from danom import Stream
+
+            Stream.from_iterable(file_paths).map(async_read_files).async_collect(concurrency=64)
+
         """
+        if concurrency is not None and concurrency < 1:
+            raise ValueError(f"`concurrency` must be a positive integer, got {concurrency}")
+
         if not self.ops:
             return cast(Awaitable[tuple[U, ...]], self.collect())
 
-        res = await asyncio.gather(*(_async_apply_fns(x, self.ops) for x in self.seq))
-        return cast(
-            Awaitable[tuple[U, ...]], tuple(elem for elem in res if elem != _Nothing.NOTHING)
-        )
+        step = _compile_ops(self.ops, is_async=True)
+        if concurrency is None:
+            res = await asyncio.gather(*(step(x) for x in self.seq))
+        else:
+            res = await _bounded_gather(step, self.seq, concurrency)
+        nothing = _Nothing.NOTHING
+        return cast(Awaitable[tuple[U, ...]], tuple([elem for elem in res if elem is not nothing]))
 
 
 _MAP = 0
@@ -517,22 +616,48 @@ PlannedOps = tuple[str, StreamFn]
 AsyncPlannedOps = tuple[str, AsyncStreamFn]
 
 
-def _apply_fns_worker[T](args: tuple[tuple[T], tuple[PlannedOps, ...]]) -> tuple[T, ...]:
-    seq, ops = args
-    return _par_apply_fns(seq, ops)
+_WORKER_STATE: dict[str, Callable] = {}
+
+
+def _init_worker(ops: tuple[PlannedOps, ...]) -> None:
+    _WORKER_STATE["step"] = _compile_ops(ops)
+
 
+def _apply_fns_worker[T](seq: list[T]) -> list[T]:
+    return _apply_step(_WORKER_STATE["step"], seq)
 
-@attrs.define(frozen=True, hash=True, eq=True)
+
+@attrs.define(slots=True, frozen=True, hash=True, eq=True)
 class _Tap:
     fn: Callable
 
     def __call__(self, value: T) -> T:
-        deepcopy(self.fn(value))
+        self.fn(_tap_copy(value))
+        return value
+
+
+# exact types only, a subclass can carry mutable attributes
+_IMMUTABLE_TYPES = frozenset({int, float, complex, bool, str, bytes, range, type(None)})
+_IMMUTABLE_CONTAINERS = frozenset({tuple, frozenset})
+
+
+def _tap_copy[T](value: T) -> T:
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+    if value_type in _IMMUTABLE_CONTAINERS and all(
+        type(v) in _IMMUTABLE_TYPES for v in cast(Iterable, value)
+    ):
         return value
+    return deepcopy(value)
 
 
 def _apply_fns[T](elements: tuple[T], ops: tuple[PlannedOps, ...]) -> tuple[T, ...]:
-    pipeline = elements
+    return tuple(_iter_fns(elements, ops))
+
+
+def _iter_fns[T](elements: Iterable[T], ops: tuple[PlannedOps, ...]) -> Iterator[T]:
+    pipeline = iter(elements)
     for op, fn in ops:
         if op == _MAP:
             pipeline = map(fn, pipeline)
@@ -543,34 +668,44 @@ def _apply_fns[T](elements: tuple[T], ops: tuple[PlannedOps, ...]) -> tuple[T, .
         else:
             raise RuntimeError("Invalid operation selected. Valid options [map, filter, tap]")
 
-    return tuple(pipeline)  # ty: ignore[invalid-return-type]
-
-
-def _par_apply_fns[T](elements: tuple[T], ops: tuple[PlannedOps, ...]) -> tuple[T, ...]:
-    results = []
-    for elem in elements:
-        valid = True
-        res = elem
-        for op, op_fn in ops:
-            if op == _MAP:
-                res = op_fn(res)
-            elif op == _FILTER and not op_fn(res):
-                valid = False
-                break
-            elif op == _TAP:
-                op_fn(deepcopy(res))
-        if valid:
-            results.append(res)
-    return tuple(results)
-
-
-async def _async_apply_fns[T](elem: T, ops: tuple[AsyncPlannedOps, ...]) -> T | _Nothing:
-    res = elem
-    for op, op_fn in ops:
+    return pipeline  # ty: ignore[invalid-return-type]
+
+
+def _apply_step[T](step: Callable, elements: Iterable[T]) -> list[T]:
+    nothing = _Nothing.NOTHING
+    return [res for res in map(step, elements) if res is not nothing]
+
+
+async def _bounded_gather[T](step: Callable, seq: tuple[T, ...], limit: int) -> list[T | _Nothing]:
+    # a fixed pool of workers pulls from one shared iterator so only `limit` coroutines are ever pending
+    results: list[T | _Nothing] = [_Nothing.NOTHING] * len(seq)
+    items = iter(enumerate(seq))
+
+    async def worker() -> None:
+        for idx, elem in items:
+            results[idx] = await step(elem)
+
+    await asyncio.gather(*(worker() for _ in range(min(limit, len(seq)))))
+    return results
+
+
+def _compile_ops(
+    ops: tuple[PlannedOps | AsyncPlannedOps, ...], *, is_async: bool = False
+) -> Callable:
+    await_ = "await " if is_async else ""
+    namespace: dict[str, object] = {"tap_copy": _tap_copy, "NOTHING": _Nothing.NOTHING}
+    lines: list[str] = [f"{'async ' if is_async else ''}def step(x):"]
+    for idx, (op, fn) in enumerate(ops):
+        name = f"fn_{idx}"
+        namespace[name] = fn
         if op == _MAP:
-            res = await op_fn(res)
-        elif op == _FILTER and not await op_fn(res):
-            return _Nothing.NOTHING
+            lines.append(f"    x = {await_}{name}(x)")
+        elif op == _FILTER:
+            lines.append(f"    if not {await_}{name}(x):\n        return NOTHING")
         elif op == _TAP:
-            await op_fn(deepcopy(res))
-    return res  # ty: ignore[invalid-return-type]
+            lines.append(f"    {await_}{name}(tap_copy(x))")
+        else:
+            raise RuntimeError("Invalid operation selected. Valid options [map, filter, tap]")
+    lines.append("    return x")
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return cast(Callable, namespace["step"])
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Sequence
-from functools import reduce
 from operator import not_
 from typing import ParamSpec, TypeVar
 
@@ -15,16 +14,32 @@ Composable = Callable[[T_co], T_co | U_co]
 Filterable = Callable[[T_co], bool]
 
 
-@attrs.define(frozen=True, hash=True, eq=True)
+@attrs.define(slots=True, frozen=True, hash=True, eq=True)
 class _Compose:
     fns: Sequence[Composable]
 
     def __call__(self, initial: T_co) -> T_co | U_co:
-        return reduce(_apply, self.fns, initial)  # ty: ignore[invalid-return-type]
+        value = initial
+        for fn in self.fns:
+            value = fn(value)
+        return value
 
 
-def _apply[T_co](value: T_co, fn: Composable) -> T_co | U_co:
-    return fn(value)
+@attrs.define(slots=True, frozen=True, hash=True, eq=True)
+class _Compose2(_Compose):
+    def __call__(self, initial: T_co) -> T_co | U_co:
+        first, second = self.fns
+        return second(first(initial))
+
+
+@attrs.define(slots=True, frozen=True, hash=True, eq=True)
+class _Compose3(_Compose):
+    def __call__(self, initial: T_co) -> T_co | U_co:
+        first, second, third = self.fns
+        return third(second(first(initial)))
+
+
+_COMPOSE_BY_ARITY: dict[int, type[_Compose]] = {2: _Compose2, 3: _Compose3}
 
 
 def compose(*fns: Composable) -> Composable:
@@ -41,20 +56,25 @@ def compose(*fns: Composable) -> Composable:
         add_two_is_even = compose(add_one, add_one, is_even)
         add_two_is_even(0) == True
     """
-    return _Compose(fns)
+    return _COMPOSE_BY_ARITY.get(len(fns), _Compose)(fns)
 
 
-@attrs.define(frozen=True, hash=True, eq=True)
+@attrs.define(slots=True, frozen=True, hash=True, eq=True)
 class _AllOf:
     fns: Sequence[Filterable]
 
     def __call__(self, item: T_co) -> bool:
-        return all(fn(item) for fn in self.fns)
+        for fn in self.fns:  # noqa: SIM110 # `all` over a generator is ~2.5x slower per call
+            if not fn(item):
+                return False
+        return True
 
 
 def all_of(*fns: Filterable) -> Filterable:
     """``True`` if all of the given functions return ``True``.
 
+    The functions are called in order and stop at the first ``False``, so put the cheapest or most selective check first.
+
     .. code-block:: python
 
         from danom import all_of
@@ -65,17 +85,22 @@ def all_of(*fns: Filterable) -> Filterable:
     return _AllOf(fns)
 
 
-@attrs.define(frozen=True, hash=True, eq=True)
+@attrs.define(slots=True, frozen=True, hash=True, eq=True)
 class _AnyOf:
     fns: Sequence[Filterable]
 
     def __call__(self, item: T_co) -> bool:
-        return any(fn(item) for fn in self.fns)
+        for fn in self.fns:  # noqa: SIM110 # same as `_AllOf`
+            if fn(item):
+                return True
+        return False
 
 
 def any_of(*fns: Filterable) -> Filterable:
     """``True`` if any of the given functions return ``True``.
 
+    The functions are called in order and stop at the first ``True``, so put the cheapest or most likely check first.
+
     .. code-block:: python
 
         from danom import any_of
@@ -137,5 +162,16 @@ def invert(func: Filterable) -> Filterable:
 
         invert(has_len)("abc") == False
         invert(has_len)("") == True
+
+    Inverting an already inverted function collapses back to the original function coerced to ``bool``, rather than stacking another wrapper.
     """
+    if isinstance(func, _Compose2) and func.fns[1] is not_:
+        inner = func.fns[0]
+        return inner if _returns_bool(inner) else compose(inner, bool)
     return compose(func, not_)
+
+
+def _returns_bool(func: Filterable) -> bool:
+    if isinstance(func, (_AllOf, _AnyOf)):
+        return True
+    return isinstance(func, _Compose2) and func.fns[1] in {not_, bool}
@@ -1,3 +1,5 @@
+"""PYTEST_DONT_REWRITE"""
+
 from __future__ import annotations
 
 import asyncio
@@ -9,6 +11,8 @@ from danom import safe, safe_method
 from danom._result import Err, Ok, Result
 
 REPO_ROOT = Path(__file__).parents[1]
+MOCK_DATA_DIR = REPO_ROOT / "tests" / "mock_data"
+MOCK_DATA_PATHS = tuple(sorted(MOCK_DATA_DIR.glob("*")))
 
 
 def is_positive(x: float) -> bool:
@@ -76,12 +80,11 @@ def lt_10(x: float) -> bool:
 
 
 async def async_is_file(path: Path) -> bool:
-    return path.is_file()  # noqa: ASYNC240
+    return await asyncio.to_thread(path.is_file)
 
 
 async def async_read_text(path: str) -> str:
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, Path(path).read_text)
+    return await asyncio.to_thread(Path(path).read_text)
 
 
 @safe
@@ -135,6 +138,10 @@ class Adder:
         return a + b
 
 
+def append_zero(values: list) -> None:
+    values.append(0)
+
+
 class ValueLogger:
     def __init__(self, values: list | ListProxy | None = None) -> None:
         self.values = values if values is not None else []
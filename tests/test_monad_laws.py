@@ -1,25 +1,31 @@
 from __future__ import annotations
 
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from danom import Either, Err, Left, Result
 
+# skip the on-disk example database writes and the per-example deadline, which can flake on a cold first call
+LAW_SETTINGS = settings(database=None, deadline=None)
+
+INNERS = st.one_of(st.integers(), st.text(), st.floats(allow_nan=False, allow_infinity=False))
 
-def monad_tests(parent: type[Result | Either], err_monad: type[Err | Left]):
-    inners = st.one_of(st.integers(), st.text(), st.floats(allow_nan=False, allow_infinity=False))
 
-    results = st.one_of(inners.map(parent.unit), st.just(err_monad(1)))
+def monad_tests(parent: type[Result | Either], err_monad: type[Err | Left]):
+    results = st.one_of(INNERS.map(parent.unit), st.just(err_monad(1)))
     safe_fns = st.sampled_from([lambda x: parent.unit(x * 2), err_monad])
 
-    @given(inner=inners, f=safe_fns)
+    @LAW_SETTINGS
+    @given(inner=INNERS, f=safe_fns)
     def test_monadic_left_identity(inner, f):
         assert parent.unit(inner).and_then(f) == f(inner)
 
+    @LAW_SETTINGS
     @given(results)
     def test_monadic_right_identity(monad):
         assert monad.and_then(parent.unit) == monad
 
+    @LAW_SETTINGS
     @given(monad=results, f=safe_fns, g=safe_fns, h=safe_fns)
     def test_monadic_associativity(monad, f, g, h):
         assert monad.and_then(f).and_then(g).or_else(h) == monad.and_then(
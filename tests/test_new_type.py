@@ -6,7 +6,7 @@ import pytest
 from hypothesis import given
 
 from danom import new_type
-from danom._new_type import _validate_bool_func
+from danom._new_type import _new_type, _validate_bool_func
 from tests.conftest import has_len
 
 
@@ -114,3 +114,39 @@ def test_validate_bool_func(args):
 
     with expected_context:
         _validate_bool_func(bool_fn)(object(), attr, value)
+
+
+def test_new_type_is_cached():
+    assert new_type("TestType", str, has_len) is new_type("TestType", str, [has_len])
+    assert new_type("TestType", str, has_len) is not new_type("TestType", str, has_len, str.strip)
+
+
+def test_new_type_cache_is_bounded():
+    maxsize = _new_type.cache_info().maxsize
+    assert maxsize is not None
+
+    for _ in range(maxsize + 1):
+        new_type("TestType", str, validators=[lambda s: "@" in s])
+
+    assert _new_type.cache_info().currsize == maxsize
+
+
+class UnhashableValidator:
+    __hash__ = None
+
+    def __call__(self, value: str) -> bool:
+        return len(value) > 0
+
+
+def test_new_type_with_unhashable_validator():
+    TestType = new_type("TestType", str, UnhashableValidator())  # noqa: N806
+    assert TestType("abc").inner == "abc"
+
+    with pytest.raises(ValueError):
+        TestType("")
+
+
+def test_new_type_forwarder_metadata():
+    TestType = new_type("TestType", str)  # noqa: N806
+    assert TestType.upper.__module__ == "danom._new_type"
+    assert TestType.upper.__qualname__ == "TestType.upper"
@@ -1,9 +1,11 @@
+import pickle
 from contextlib import nullcontext
 
+import attrs
 import pytest
 
 from danom import Err, Ok, Result
-from tests.conftest import add_one
+from tests.conftest import add_one, div_zero
 
 
 @pytest.mark.parametrize(
@@ -58,6 +60,14 @@ def test_is_ok(monad, expected_result):
     assert monad.is_ok() == expected_result
 
 
+@pytest.mark.parametrize(
+    ("monad", "expected_result"),
+    [pytest.param(Ok(None), True), pytest.param(Ok(0), True), pytest.param(Err(), False)],
+)
+def test_bool(monad, expected_result):
+    assert bool(monad) == expected_result
+
+
 @pytest.mark.parametrize(
     ("monad", "func", "expected_result"),
     [pytest.param(Ok(0), add_one, Ok(1)), pytest.param(Err(), add_one, Err())],
@@ -99,6 +109,24 @@ def test_err_details(err, expected_details):
     assert monad.details == expected_details
 
 
+def test_err_hash():
+    assert hash(div_zero(1)) == hash(div_zero(1))
+    assert len({div_zero(1), div_zero(1), div_zero(2), Err(1), Err(1)}) == 3
+
+
+@pytest.mark.parametrize(
+    ("capture_locals", "expected_locals"), [pytest.param(False, None), pytest.param(True, {"x": 1})]
+)
+def test_err_details_capture_locals(monkeypatch, capture_locals, expected_locals):
+    monkeypatch.setattr(Err, "capture_locals", capture_locals)
+    err = div_zero(1)
+    assert isinstance(err, Err)
+    *_, last_frame = err.details
+
+    assert last_frame["func"] == "div_zero"
+    assert last_frame.get("locals") == expected_locals
+
+
 @pytest.mark.parametrize(
     ("monad", "expected_result"), [pytest.param(Ok(None), True), pytest.param(Err(), False)]
 )
@@ -120,3 +148,50 @@ def test_staticmethod_result_is_ok(monad, expected_result):
 def test_staticmethod_result_unwrap(monad, expected_result, expected_context):
     with expected_context:
         assert Result.result_unwrap(monad) == expected_result
+
+
+@pytest.mark.parametrize(
+    "monad", [pytest.param(Ok(1)), pytest.param(Err("an err")), pytest.param(div_zero(1))]
+)
+def test_pickle_roundtrip(monad):
+    assert pickle.loads(pickle.dumps(monad)) == monad  # noqa: S301
+
+
+@pytest.mark.parametrize(
+    ("monad", "attr"), [pytest.param(Ok(1), "inner"), pytest.param(Err("an err"), "error")]
+)
+def test_monads_are_frozen(monad, attr):
+    with pytest.raises(attrs.exceptions.FrozenInstanceError):
+        setattr(monad, attr, 2)
+
+
+@pytest.mark.parametrize(
+    ("monad", "expected_result"),
+    [
+        pytest.param(Ok(1), "Ok(inner=1)"),
+        pytest.param(Err("an err"), "Err(error='an err')"),
+        pytest.param(div_zero(1), "Err(error=ZeroDivisionError('division by zero'))"),
+    ],
+)
+def test_repr(monad, expected_result):
+    assert repr(monad) == expected_result
+
+
+@pytest.mark.parametrize(
+    ("monad", "expected_result"),
+    [
+        pytest.param(Ok(1), {"inner": 1}),
+        pytest.param(
+            Err("an err", input_args=((1,), {})),
+            {"error": "an err", "input_args": ((1,), {}), "traceback": "", "details": []},
+        ),
+    ],
+)
+def test_attrs_asdict(monad, expected_result):
+    assert attrs.has(type(monad))
+    assert attrs.asdict(monad) == expected_result
+
+
+def test_attrs_evolve():
+    assert attrs.evolve(Ok(1), inner=2) == Ok(2)
+    assert attrs.evolve(Err("an err"), input_args=((1,), {})) == Err("an err", ((1,), {}))
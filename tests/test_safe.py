@@ -65,9 +65,9 @@ def test_traceback():
 
     expected_lines = [
         "Traceback (most recent call last):",
-        '  File "./src/danom/_safe.py", line 31, in wrapper',
+        '  File "./src/danom/_safe.py", line 38, in wrapper',
         "    return Ok(func(*args, **kwargs))",
-        '  File "./tests/conftest.py", line 117, in div_zero',
+        '  File "./tests/conftest.py", line 120, in div_zero',
         "    return x / 0",
         "ZeroDivisionError: division by zero",
     ]
@@ -85,3 +85,37 @@ def test_traceback():
 def test_safe_on_method():
     cls = Adder()
     assert cls.safe_add(2, 2) == Ok(4)
+
+
+def test_traceback_is_not_extended_by_unwrap():
+    err = div_zero(1)
+    assert isinstance(err, Err)
+
+    with pytest.raises(ZeroDivisionError):
+        err.unwrap()
+
+    assert "in unwrap" not in err.traceback
+    assert [d["func"] for d in err.details] == ["wrapper", "div_zero"]
+    assert err == Err(ZeroDivisionError("division by zero"), input_args=((1,), {}))
+
+
+def _unwrap_while_handling_key_error(err: Err) -> None:
+    try:
+        {}["unrelated"]
+    except KeyError:
+        err.unwrap()
+
+
+def test_traceback_is_not_chained_by_unwrap():
+    err = div_zero(1)
+    assert isinstance(err, Err)
+
+    with pytest.raises(ZeroDivisionError):
+        _unwrap_while_handling_key_error(err)
+
+    assert "KeyError" not in err.traceback
+    assert err.traceback.startswith("Traceback (most recent call last):")
+
+
+def test_safe_keeps_undecorated_function():
+    assert safe_add.__wrapped__(1, 2) == 3  # ty: ignore[unresolved-attribute]
@@ -1,3 +1,4 @@
+import operator
 from contextlib import nullcontext
 from multiprocessing import Manager
 from pathlib import Path
@@ -6,16 +7,18 @@ import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
-from danom import Stream
+from danom import Stream, identity
 from danom._either import Right
 from danom._result import Err, Ok
-from danom._stream import _FILTER, _MAP, _TAP, _apply_fns
+from danom._stream import _FILTER, _MAP, _TAP, _apply_fns, _apply_step, _compile_ops, _tap_copy
 from tests.conftest import (
+    MOCK_DATA_PATHS,
     REPO_ROOT,
     AsyncValueLogger,
     ValueLogger,
     add,
     add_one,
+    append_zero,
     async_is_file,
     async_read_text,
     divisible_by_3,
@@ -105,6 +108,11 @@ def test_stream_to_par_stream(collect_fn, kwargs):
         pytest.param(range(10), 0, add, 1, 45),
         pytest.param(range(10), 0, add, 4, 45),
         pytest.param(range(10), 5, add, 4, 50),
+        pytest.param(range(10), 5, operator.add, 1, 50),
+        pytest.param(("a", "b"), "", operator.add, 1, "ab"),
+        pytest.param((0.1,) * 10, 0, operator.add, 1, 0.9999999999999999),
+        pytest.param(range(1, 5), 2, operator.mul, 1, 48),
+        pytest.param(("a", 3), 1, operator.mul, 1, "aaa"),
     ],
 )
 def test_fold(starting, initial, fn, workers, expected_result):
@@ -121,8 +129,11 @@ def test_fold(starting, initial, fn, workers, expected_result):
     ],
 )
 def test_tap(collect_fn, kwargs):
-    with Manager() as manager:
-        values = manager.list()
+    # only worker processes need a shared list, everything else can log in-process
+    uses_processes = collect_fn == "par_collect" and not kwargs.get("use_threads", False)
+
+    with Manager() if uses_processes else nullcontext() as manager:
+        values = manager.list() if manager is not None else []
         val_logger = ValueLogger(values)
 
         assert _get_attr_collect(
@@ -137,6 +148,37 @@ def test_tap(collect_fn, kwargs):
         assert sorted(values) == [1, 1, 2, 2, 3, 3, 4, 4]
 
 
+@pytest.mark.parametrize(
+    ("collect_fn", "kwargs"),
+    [
+        pytest.param("collect", {}, id="simple `collect`"),
+        pytest.param("par_collect", {"workers": 4}, id="`par_collect` with workers passed in"),
+        pytest.param("par_collect", {"use_threads": True}, id="`par_collect` with threads True"),
+    ],
+)
+def test_tap_does_not_mutate_items(collect_fn, kwargs):
+    assert _get_attr_collect(
+        Stream.from_iterable([[1], [2]]).tap(append_zero), collect_fn, kwargs
+    ) == ([1], [2])
+
+
+@pytest.mark.parametrize(
+    ("value", "is_same_object"),
+    [
+        pytest.param(1, True, id="int is passed through"),
+        pytest.param("a", True, id="str is passed through"),
+        pytest.param((1, "a", None), True, id="flat tuple of immutables is passed through"),
+        pytest.param(frozenset({1, 2}), True, id="flat frozenset of immutables is passed through"),
+        pytest.param(([1],), False, id="tuple holding a list is copied"),
+        pytest.param([1], False, id="list is copied"),
+    ],
+)
+def test_tap_copy(value, is_same_object):
+    res = _tap_copy(value)
+    assert res == value
+    assert (res is value) == is_same_object
+
+
 @pytest.mark.parametrize(
     ("kwargs"),
     [
@@ -181,22 +223,27 @@ def test_sequence(kwargs, seq, expected_result, expected_context):
 
 
 @pytest.mark.asyncio
-async def test_async_collect():
-    assert await Stream.from_iterable(
-        sorted(Path(f"{REPO_ROOT}/tests/mock_data").glob("*"))  # noqa: ASYNC240
-    ).filter(async_is_file).map(async_read_text).async_collect() == (
-        "",
-        "x = 1\n",
-        "y = 2\n",
-        "z = 3\n",
-    )
+@pytest.mark.parametrize("concurrency", [None, 1, 2, 100])
+async def test_async_collect(concurrency):
+    assert await Stream.from_iterable(MOCK_DATA_PATHS).filter(async_is_file).map(
+        async_read_text
+    ).async_collect(concurrency=concurrency) == ("", "x = 1\n", "y = 2\n", "z = 3\n")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", [0, -1])
+async def test_async_collect_invalid_concurrency(concurrency):
+    with pytest.raises(ValueError, match="concurrency"):
+        await (
+            Stream.from_iterable(range(4))
+            .map(async_read_text)
+            .async_collect(concurrency=concurrency)
+        )
 
 
 @pytest.mark.asyncio
 async def test_async_collect_no_fns():
-    assert await Stream.from_iterable(
-        sorted(Path(f"{REPO_ROOT}/tests/mock_data").glob("*"))  # noqa: ASYNC240
-    ).async_collect() == (
+    assert await Stream.from_iterable(MOCK_DATA_PATHS).async_collect() == (
         Path(f"{REPO_ROOT}/tests/mock_data/__init__.py"),
         Path(f"{REPO_ROOT}/tests/mock_data/dir_should_skip"),
         Path(f"{REPO_ROOT}/tests/mock_data/file_a.py"),
@@ -217,6 +264,30 @@ async def test_async_tap():
     assert sorted(val_logger_2.values) == [0, 1, 2, 3]
 
 
+def test_iterate():
+    stream = Stream.from_iterable(range(10)).map(add_one).filter(divisible_by_3)
+    it = stream.iterate()
+
+    assert next(it) == 3
+    assert tuple(it) == (6, 9)
+    assert tuple(stream.iterate()) == stream.collect() == (3, 6, 9)
+
+
+def test_map_identity_is_skipped():
+    stream = Stream.from_iterable(range(4))
+    assert stream.map(identity) is stream
+    assert stream.map(identity).collect() == (0, 1, 2, 3)
+
+
+def test_chaining_does_not_mutate_parent():
+    base = Stream.from_iterable(range(4)).map(add_one)
+    evens = base.filter(is_even)
+
+    assert base.collect() == (1, 2, 3, 4)
+    assert evens.collect() == (2, 4)
+    assert base.map(add_one).collect() == (2, 3, 4, 5)
+
+
 @given(
     st.one_of(
         st.tuples(st.lists(st.integers(), min_size=1), st.just(True)),
@@ -252,3 +323,27 @@ def test_stream_bool(args):
 def test_apply_fns(elements, ops, expected_result, expected_context):
     with expected_context:
         assert list(_apply_fns(elements, ops)) == expected_result
+
+
+@pytest.mark.parametrize(
+    ("elements", "ops", "expected_result", "expected_context"),
+    [
+        pytest.param(
+            range(4),
+            ((_MAP, add_one), (_FILTER, divisible_by_3), (_TAP, add_one)),
+            [3],
+            nullcontext(),
+            id="valid operations don't raise any errors",
+        ),
+        pytest.param(
+            range(4),
+            (("INVALID", add_one),),
+            None,
+            pytest.raises(RuntimeError),
+            id="raises if given invalid operation",
+        ),
+    ],
+)
+def test_apply_step(elements, ops, expected_result, expected_context):
+    with expected_context:
+        assert _apply_step(_compile_ops(ops), elements) == expected_result
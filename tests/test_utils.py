@@ -8,7 +8,15 @@ from tests.conftest import add_one, divisible_by_3, divisible_by_5, has_len
 
 @pytest.mark.parametrize(
     ("inp_args", "fns", "expected_result"),
-    [pytest.param(0, (add_one, add_one), 2), pytest.param(0, (add_one, divisible_by_3), False)],
+    [
+        pytest.param(0, (), 0, id="no functions returns the input"),
+        pytest.param(0, (add_one,), 1),
+        pytest.param(0, (add_one, add_one), 2),
+        pytest.param(0, (add_one, divisible_by_3), False),
+        pytest.param(0, (add_one, add_one, add_one), 3),
+        pytest.param(0, (add_one, add_one, divisible_by_3), False),
+        pytest.param(0, (add_one, add_one, add_one, add_one), 4),
+    ],
 )
 def test_compose(inp_args, fns, expected_result):
     assert compose(*fns)(inp_args) == expected_result
@@ -80,3 +88,21 @@ def test_invert(input_args, fn, expected_result):
 )
 def test_two_inverts_returns_same_as_original_fn(input_args, fn, expected_result):
     assert invert(invert(fn))(input_args) == expected_result
+
+
+def test_two_inverts_keeps_bool_result():
+    has_items = invert(invert(len))  # ty: ignore[invalid-argument-type]
+    assert has_items("abc") is True
+    assert has_items("") is False
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [
+        pytest.param(all_of(has_len, divisible_by_3), id="all_of"),
+        pytest.param(any_of(has_len, divisible_by_3), id="any_of"),
+        pytest.param(none_of(has_len, divisible_by_3), id="none_of"),
+    ],
+)
+def test_two_inverts_unwraps_bool_combinators(fn):
+    assert invert(invert(fn)) == fn